@@ -4,33 +4,65 @@ mod2fix - Minecraft Mod Error Analyzer & Dependency Resolver
 Diagnose mod crashes, check dependencies, and get direct download links
 """
 
+import os
 import re
 import sys
 import json
+import mmap
+import time
+import asyncio
+import contextlib
+import functools
+import hashlib
+import io
+import tempfile
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from urllib.parse import urlencode
+from typing import Any, BinaryIO, Dict, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass, asdict
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 import argparse
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     print("⚠️  'requests' not installed. Online features disabled.")
 
 try:
-    import tomli
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import tomllib as _toml
     TOMLI_AVAILABLE = True
 except ImportError:
-    TOMLI_AVAILABLE = False
-    print("⚠️  'tomli' not installed. Some Forge mods may not be readable.")
+    try:
+        import tomli as _toml
+        TOMLI_AVAILABLE = True
+    except ImportError:
+        TOMLI_AVAILABLE = False
+        print("⚠️  'tomli' not installed. Some Forge mods may not be readable.")
 
 __version__ = "1.0.0"
 
-@dataclass
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'mod2fix'
+
+@dataclass(slots=True, frozen=True)
 class ModInfo:
     """Store mod information"""
     mod_id: str
@@ -45,10 +77,157 @@ class ModInfo:
         return f"{self.name} ({self.mod_id}) v{self.version}"
 
 
+def _json_loads(content):
+    """Parse JSON from str or bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (BOMs, NaN), retry with the stdlib parser
+            pass
+    return json.loads(content)
+
+
+def _write_json_atomic(path: Path, data: Any):
+    """Write a JSON cache file without exposing partial writes"""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=path.parent,
+                                         suffix='.tmp', delete=False) as f:
+            json.dump(data, f)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+
+def create_http_session() -> Optional["requests.Session"]:
+    """Create a keep-alive session that backs off on rate limits"""
+    if not REQUESTS_AVAILABLE:
+        return None
+    
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+    session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries))
+    return session
+
+
+HTTP_SESSION = create_http_session()
+
+
 class ModrinthAPI:
     """Interface with Modrinth API for mod downloads"""
     
     BASE_URL = "https://api.modrinth.com/v2"
+    _session = HTTP_SESSION
+    BULK_CHUNK_SIZE = 200
+    MAX_CONCURRENCY = 8
+    MAX_RETRIES = 3
+    CACHE_TTL = 86400  # Seconds, 0 disables the response cache
+    _CACHE_DIR = CACHE_DIR / 'responses'
+    _cache_pruned = False
+    
+    @staticmethod
+    def _cache_file(url: str, params: Optional[Dict] = None) -> Path:
+        """Get the cache file for a request"""
+        key = repr((url, sorted((params or {}).items())))
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return ModrinthAPI._CACHE_DIR / f"{digest}.json"
+    
+    @staticmethod
+    def _cache_read(cache_file: Path) -> Optional[Tuple[int, Any]]:
+        """Read a cached response if it has not expired"""
+        if ModrinthAPI.CACHE_TTL <= 0:
+            return None
+        if not ModrinthAPI._cache_pruned:
+            ModrinthAPI.prune_cache()
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            if time.time() - entry['ts'] < ModrinthAPI.CACHE_TTL:
+                return entry['status'], entry['body']
+            cache_file.unlink()
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return None
+    
+    @staticmethod
+    def prune_cache():
+        """Delete expired responses, and temp files left by interrupted writes"""
+        ModrinthAPI._cache_pruned = True
+        cutoff = time.time() - ModrinthAPI.CACHE_TTL
+        try:
+            entries = list(os.scandir(ModrinthAPI._CACHE_DIR))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                if entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _cache_write(cache_file: Path, status: int, body: Any):
+        """Store a successful response"""
+        if ModrinthAPI.CACHE_TTL <= 0 or status != 200:
+            return
+        _write_json_atomic(cache_file, {'ts': time.time(), 'status': status, 'body': body})
+    
+    @staticmethod
+    def _cached_get(url: str, params: Optional[Dict] = None) -> Tuple[int, Any]:
+        """GET a JSON endpoint through the on-disk cache"""
+        cache_file = ModrinthAPI._cache_file(url, params)
+        cached = ModrinthAPI._cache_read(cache_file)
+        if cached:
+            return cached
+        
+        response = ModrinthAPI._session.get(url, params=params, timeout=10)
+        body = response.json() if response.status_code == 200 else None
+        ModrinthAPI._cache_write(cache_file, response.status_code, body)
+        return response.status_code, body
+    
+    @staticmethod
+    def _cached_post(url: str, payload: Dict) -> Tuple[int, Any]:
+        """POST a JSON body to a lookup endpoint through the on-disk cache"""
+        cache_file = ModrinthAPI._cache_file(url, {'json': json.dumps(payload, sort_keys=True)})
+        cached = ModrinthAPI._cache_read(cache_file)
+        if cached:
+            return cached
+        
+        response = ModrinthAPI._session.post(url, json=payload, timeout=10)
+        body = response.json() if response.status_code == 200 else None
+        ModrinthAPI._cache_write(cache_file, response.status_code, body)
+        return response.status_code, body
+    
+    @staticmethod
+    async def _cached_get_async(session: "aiohttp.ClientSession", url: str, params: Optional[Dict] = None,
+                                semaphore: Optional[asyncio.Semaphore] = None) -> Tuple[int, Any]:
+        """Async variant of _cached_get"""
+        cache_file = ModrinthAPI._cache_file(url, params)
+        cached = ModrinthAPI._cache_read(cache_file)
+        if cached:
+            return cached
+        
+        for attempt in range(ModrinthAPI.MAX_RETRIES + 1):
+            async with semaphore or contextlib.nullcontext():
+                async with session.get(url, params=params) as response:
+                    status = response.status
+                    if status != 429 or attempt == ModrinthAPI.MAX_RETRIES:
+                        body = await response.json() if status == 200 else None
+                        break
+                    retry_after = response.headers.get('Retry-After', '1')
+            # Rate limited, back off for as long as the server asks
+            await asyncio.sleep(ModrinthAPI._retry_delay(retry_after))
+        ModrinthAPI._cache_write(cache_file, status, body)
+        return status, body
+    
+    @staticmethod
+    def _retry_delay(retry_after: str) -> float:
+        """Parse a Retry-After header given in seconds"""
+        try:
+            return min(max(float(retry_after), 0.0), 60.0)
+        except ValueError:
+            return 1.0
     
     @staticmethod
     def search_mod(mod_id: str, limit: int = 1) -> Optional[Dict]:
@@ -59,16 +238,42 @@ class ModrinthAPI:
         try:
             url = f"{ModrinthAPI.BASE_URL}/search"
             params = {"query": mod_id, "limit": limit}
-            response = requests.get(url, params=params, timeout=10)
+            status, data = ModrinthAPI._cached_get(url, params)
             
-            if response.status_code == 200:
-                data = response.json()
+            if status == 200:
                 if data.get('hits'):
                     return data['hits'][0]
         except Exception as e:
             print(f"⚠️  Modrinth API error: {e}")
         return None
     
+    @staticmethod
+    async def search_mod_async(session: "aiohttp.ClientSession", mod_id: str,
+                               semaphore: Optional[asyncio.Semaphore] = None) -> Optional[Dict]:
+        """Async variant of search_mod using a shared aiohttp session"""
+        try:
+            url = f"{ModrinthAPI.BASE_URL}/search"
+            params = {"query": mod_id, "limit": 1}
+            status, data = await ModrinthAPI._cached_get_async(session, url, params, semaphore)
+            
+            if status == 200:
+                if data.get('hits'):
+                    return data['hits'][0]
+        except Exception as e:
+            print(f"⚠️  Modrinth API error: {e}")
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _version_query(minecraft_version: Optional[str], loader: Optional[str]) -> str:
+        """Build the encoded version filter query, once per MC version and loader"""
+        params = {}
+        if minecraft_version:
+            params['game_versions'] = json.dumps([minecraft_version])
+        if loader:
+            params['loaders'] = json.dumps([loader.lower()])
+        return f"?{urlencode(params)}" if params else ""
+    
     @staticmethod
     def get_mod_versions(project_id: str, minecraft_version: Optional[str] = None, loader: Optional[str] = None) -> List[Dict]:
         """Get mod versions filtered by MC version and loader"""
@@ -76,18 +281,29 @@ class ModrinthAPI:
             return []
             
         try:
-            url = f"{ModrinthAPI.BASE_URL}/project/{project_id}/version"
-            params = {}
+            query = ModrinthAPI._version_query(minecraft_version, loader)
+            url = f"{ModrinthAPI.BASE_URL}/project/{project_id}/version{query}"
             
-            if minecraft_version:
-                params['game_versions'] = f'["{minecraft_version}"]'
-            if loader:
-                params['loaders'] = f'["{loader.lower()}"]'
+            status, versions = ModrinthAPI._cached_get(url)
             
-            response = requests.get(url, params=params, timeout=10)
+            if status == 200:
+                return versions
+        except Exception as e:
+            print(f"⚠️  Error fetching versions: {e}")
+        return []
+    
+    @staticmethod
+    async def get_mod_versions_async(session: "aiohttp.ClientSession", project_id: str,
+                                     minecraft_version: Optional[str], loader: Optional[str],
+                                     semaphore: Optional[asyncio.Semaphore] = None) -> List[Dict]:
+        """Async variant of get_mod_versions using a shared aiohttp session"""
+        try:
+            query = ModrinthAPI._version_query(minecraft_version, loader)
+            url = f"{ModrinthAPI.BASE_URL}/project/{project_id}/version{query}"
+            status, versions = await ModrinthAPI._cached_get_async(session, url, semaphore=semaphore)
             
-            if response.status_code == 200:
-                return response.json()
+            if status == 200:
+                return versions
         except Exception as e:
             print(f"⚠️  Error fetching versions: {e}")
         return []
@@ -104,6 +320,147 @@ class ModrinthAPI:
             return None
         versions = ModrinthAPI.get_mod_versions(project_id, minecraft_version, loader)
         
+        return ModrinthAPI._version_info(mod_info, project_id, versions)
+    
+    @staticmethod
+    async def get_best_version_async(session: "aiohttp.ClientSession", mod_id: str,
+                                     minecraft_version: Optional[str], loader: Optional[str],
+                                     semaphore: Optional[asyncio.Semaphore] = None) -> Optional[Dict]:
+        """Async variant of get_best_version using a shared aiohttp session"""
+        mod_info = await ModrinthAPI.search_mod_async(session, mod_id, semaphore)
+        if not mod_info:
+            return None
+        
+        project_id = mod_info.get('project_id') or mod_info.get('slug')
+        if not project_id:
+            return None
+        versions = await ModrinthAPI.get_mod_versions_async(session, project_id, minecraft_version, loader, semaphore)
+        
+        return ModrinthAPI._version_info(mod_info, project_id, versions)
+    
+    @staticmethod
+    async def _gather(fetch, items: List, *args) -> List:
+        """Run fetch(session, item, *args, semaphore) for every item on one shared session"""
+        # Cap open connections and in-flight requests to stay well below
+        # Modrinth's 300 req/min limit
+        connector = aiohttp.TCPConnector(limit=10)
+        timeout = aiohttp.ClientTimeout(total=10)
+        semaphore = asyncio.Semaphore(ModrinthAPI.MAX_CONCURRENCY)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*(fetch(session, item, *args, semaphore) for item in items))
+    
+    @staticmethod
+    def _can_run_async() -> bool:
+        """Check whether asyncio.run can be used from the calling thread"""
+        if not AIOHTTP_AVAILABLE:
+            return False
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return True
+        # asyncio.run cannot nest inside a running loop (e.g. an ASGI app),
+        # such callers should await get_best_versions_async instead
+        return False
+    
+    @staticmethod
+    async def get_best_versions_async(mod_ids: List[str], minecraft_version: Optional[str], loader: Optional[str]) -> List[Optional[Dict]]:
+        """Look up the best version for several mods concurrently from async code"""
+        return await ModrinthAPI._gather(ModrinthAPI.get_best_version_async, mod_ids, minecraft_version, loader)
+    
+    @staticmethod
+    def get_best_versions(mod_ids: List[str], minecraft_version: Optional[str], loader: Optional[str]) -> List[Optional[Dict]]:
+        """Look up the best version for several mods concurrently"""
+        if not ModrinthAPI._can_run_async():
+            return [ModrinthAPI.get_best_version(mod_id, minecraft_version, loader) for mod_id in mod_ids]
+        
+        return asyncio.run(ModrinthAPI.get_best_versions_async(mod_ids, minecraft_version, loader))
+    
+    @staticmethod
+    def get_many_mod_versions(project_ids: List[str], minecraft_version: Optional[str], loader: Optional[str]) -> List[List[Dict]]:
+        """Get filtered versions for several projects concurrently"""
+        if not ModrinthAPI._can_run_async():
+            return [ModrinthAPI.get_mod_versions(project_id, minecraft_version, loader) for project_id in project_ids]
+        
+        return asyncio.run(ModrinthAPI._gather(ModrinthAPI.get_mod_versions_async, project_ids, minecraft_version, loader))
+    
+    @staticmethod
+    def get_projects(mod_ids: List[str]) -> Dict[str, Dict]:
+        """Look up many projects by ID or slug with bulk requests
+        
+        The result maps every requested ID that matched a project's ID or
+        slug to that project.
+        """
+        if not REQUESTS_AVAILABLE or not mod_ids:
+            return {}
+        
+        projects = []
+        try:
+            url = f"{ModrinthAPI.BASE_URL}/projects"
+            # Chunk the ID list to keep request URLs at a sane length
+            for i in range(0, len(mod_ids), ModrinthAPI.BULK_CHUNK_SIZE):
+                chunk = mod_ids[i:i + ModrinthAPI.BULK_CHUNK_SIZE]
+                status, chunk_projects = ModrinthAPI._cached_get(url, {"ids": json.dumps(chunk)})
+                if status == 200:
+                    projects.extend(chunk_projects)
+        except Exception as e:
+            print(f"⚠️  Modrinth API error: {e}")
+        
+        results = {}
+        requested = set(mod_ids)
+        for project in projects:
+            for key in (project.get('id'), project.get('slug')):
+                if key in requested:
+                    results[key] = project
+        return results
+    
+    @staticmethod
+    def get_versions_from_hashes(hashes: List[str]) -> Dict[str, Dict]:
+        """Look up the versions of many files by SHA-1 hash with bulk requests
+        
+        The result maps every hash Modrinth knows to its version.
+        """
+        if not REQUESTS_AVAILABLE or not hashes:
+            return {}
+        
+        versions = {}
+        try:
+            url = f"{ModrinthAPI.BASE_URL}/version_files"
+            for i in range(0, len(hashes), ModrinthAPI.BULK_CHUNK_SIZE):
+                chunk = hashes[i:i + ModrinthAPI.BULK_CHUNK_SIZE]
+                status, chunk_versions = ModrinthAPI._cached_post(url, {"hashes": chunk, "algorithm": "sha1"})
+                if status == 200:
+                    versions.update(chunk_versions)
+        except Exception as e:
+            print(f"⚠️  Modrinth API error: {e}")
+        return versions
+    
+    @staticmethod
+    def bulk_get_best_versions(mod_ids: List[str], minecraft_version: Optional[str], loader: Optional[str]) -> Dict[str, Dict]:
+        """Get the best matching versions for many mods with bulk requests
+        
+        Mods whose ID does not match a Modrinth project ID or slug are left
+        out of the result so callers can fall back to searching for them.
+        """
+        projects = ModrinthAPI.get_projects(mod_ids)
+        
+        # A project lists every MC version and loader that any of its versions
+        # supports, so only projects that can match need a version lookup
+        loader_name = loader.lower() if loader else None
+        candidates = list({
+            project['id']: project for project in projects.values()
+            if (not minecraft_version or minecraft_version in project.get('game_versions', []))
+            and (not loader_name or loader_name in project.get('loaders', []))
+        })
+        versions = dict(zip(candidates, ModrinthAPI.get_many_mod_versions(candidates, minecraft_version, loader)))
+        
+        return {
+            key: ModrinthAPI._version_info(project, project['id'], versions.get(project['id'], []))
+            for key, project in projects.items()
+        }
+    
+    @staticmethod
+    def _version_info(mod_info: Dict, project_id: str, versions: List[Dict]) -> Dict:
+        """Build download info from a search hit and its versions"""
         if versions:
             # Return the first version (most recent)
             version = versions[0]
@@ -120,6 +477,10 @@ class ModrinthAPI:
                 'version_id': version.get('id'),
                 'minecraft_versions': version.get('game_versions', []),
                 'loaders': version.get('loaders', []),
+                'required_project_ids': [
+                    dep['project_id'] for dep in version.get('dependencies', [])
+                    if dep.get('dependency_type') == 'required' and dep.get('project_id')
+                ],
                 'download_url': primary_file.get('url') if primary_file else None,
                 'page_url': f"https://modrinth.com/mod/{mod_info.get('slug')}",
                 'version_url': f"https://modrinth.com/mod/{mod_info.get('slug')}/version/{version.get('id')}"
@@ -137,6 +498,7 @@ class CurseForgeAPI:
     
     BASE_URL = "https://api.curseforge.com/v1"
     API_KEY = None  # Users can set this
+    _session = HTTP_SESSION
     
     @staticmethod
     def search_mod(mod_name: str) -> Optional[Dict]:
@@ -149,7 +511,7 @@ class CurseForgeAPI:
             url = f"{CurseForgeAPI.BASE_URL}/mods/search"
             params = {"gameId": 432, "searchFilter": mod_name}
             
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = CurseForgeAPI._session.get(url, headers=headers, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 if data.get('data'):
@@ -162,53 +524,52 @@ class CurseForgeAPI:
 class DependencyChecker:
     """Check mod dependencies from mod files"""
     
-    def __init__(self, mods_folder: Optional[Path] = None):
+    INDEX_FILE = CACHE_DIR / 'mods_index.json'
+    # The first modId, displayName and version assignments of a mods.toml
+    _TOML_FALLBACK = re.compile(r'''(?P<key>modId|displayName|version)\s*=\s*["'](?P<val>[^"']+)["']''')
+    
+    def __init__(self, mods_folder: Optional[Path] = None, use_index: bool = True):
         self.mods_folder = mods_folder
+        self.use_index = use_index
         self.mod_cache = {}
         self.minecraft_version = None
         self.loader_type = None
         
+    def read_mod(self, jar_path: Path) -> Optional[ModInfo]:
+        """Read mod metadata of any supported loader, opening the jar once"""
+        return self._read_mod_zip(jar_path, jar_path)
+    
+    def read_mod_from_stream(self, fileobj: BinaryIO, filename: str) -> Optional[ModInfo]:
+        """Read mod metadata from a seekable file object, e.g. an upload"""
+        return self._read_mod_zip(fileobj, Path(filename))
+    
+    def _read_mod_zip(self, source: Union[Path, BinaryIO], jar_path: Path) -> Optional[ModInfo]:
+        """Read mod metadata from a jar path or file object"""
+        try:
+            with zipfile.ZipFile(source, 'r') as zip_file:
+                if self._has_file(zip_file, 'fabric.mod.json'):
+                    mod_info = self._parse_fabric_mod(zip_file, jar_path)
+                    if mod_info:
+                        return mod_info
+                
+                # Modern Forge (1.13+)
+                if self._has_file(zip_file, 'META-INF/mods.toml'):
+                    return self._parse_forge_toml(zip_file, jar_path)
+                
+                # Old Forge (1.12.2 and earlier)
+                if self._has_file(zip_file, 'mcmod.info'):
+                    return self._parse_forge_legacy(zip_file, jar_path)
+        except Exception as e:
+            pass
+        return None
+    
     def read_fabric_mod(self, jar_path: Path) -> Optional[ModInfo]:
         """Read Fabric mod metadata"""
         try:
             with zipfile.ZipFile(jar_path, 'r') as zip_file:
-                if 'fabric.mod.json' not in zip_file.namelist():
+                if not self._has_file(zip_file, 'fabric.mod.json'):
                     return None
-                    
-                with zip_file.open('fabric.mod.json') as f:
-                    data = json.load(f)
-                
-                dependencies = []
-                deps_data = data.get('depends', {})
-                deps_data.update(data.get('requires', {}))
-                
-                for dep_id, version in deps_data.items():
-                    if dep_id in ['java']:
-                        continue
-                    dependencies.append({
-                        'id': dep_id,
-                        'version': version if isinstance(version, str) else str(version),
-                        'required': True
-                    })
-                
-                for dep_id, version in data.get('recommends', {}).items():
-                    dependencies.append({
-                        'id': dep_id,
-                        'version': version if isinstance(version, str) else str(version),
-                        'required': False
-                    })
-                
-                mc_versions = self._parse_mc_version(deps_data.get('minecraft', '*'))
-                
-                return ModInfo(
-                    mod_id=data.get('id', 'unknown'),
-                    name=data.get('name', jar_path.stem),
-                    version=data.get('version', 'unknown'),
-                    loader='fabric',
-                    minecraft_version=mc_versions,
-                    dependencies=dependencies,
-                    file_path=str(jar_path)
-                )
+                return self._parse_fabric_mod(zip_file, jar_path)
         except Exception as e:
             pass
         return None
@@ -217,92 +578,152 @@ class DependencyChecker:
         """Read Forge mod metadata"""
         try:
             with zipfile.ZipFile(jar_path, 'r') as zip_file:
-                # Modern Forge (1.13+)
-                if 'META-INF/mods.toml' in zip_file.namelist():
-                    with zip_file.open('META-INF/mods.toml') as f:
-                        content = f.read().decode('utf-8')
-                        
-                    if TOMLI_AVAILABLE:
-                        data = tomli.loads(content)
-                    else:
-                        return self._parse_forge_toml_manual(content, jar_path)
-                    
-                    mods_list = data.get('mods', [])
-                    if not mods_list:
-                        return None
-                    
-                    mod_data = mods_list[0]
-                    mod_id = mod_data.get('modId', 'unknown')
-                    
-                    dependencies = []
-                    for dep in data.get('dependencies', {}).get(mod_id, []):
-                        if dep.get('modId') in ['forge', 'java']:
-                            continue
-                        dependencies.append({
-                            'id': dep.get('modId', 'unknown'),
-                            'version': dep.get('versionRange', '*'),
-                            'required': dep.get('mandatory', True)
-                        })
-                    
-                    mc_version = self._get_forge_mc_version(data)
-                    
-                    return ModInfo(
-                        mod_id=mod_id,
-                        name=mod_data.get('displayName', jar_path.stem),
-                        version=mod_data.get('version', 'unknown'),
-                        loader='forge',
-                        minecraft_version=self._parse_mc_version(mc_version),
-                        dependencies=dependencies,
-                        file_path=str(jar_path)
-                    )
-                
-                # Old Forge (1.12.2 and earlier)
-                elif 'mcmod.info' in zip_file.namelist():
-                    with zip_file.open('mcmod.info') as f:
-                        content = f.read().decode('utf-8')
-                        # Handle malformed JSON
-                        content = re.sub(r',\s*}', '}', content)
-                        content = re.sub(r',\s*]', ']', content)
-                        data = json.loads(content)
-                    
-                    if isinstance(data, list):
-                        data = data[0] if data else {}
-                    elif isinstance(data, dict) and 'modList' in data:
-                        data = data['modList'][0] if data['modList'] else {}
-                    
-                    dependencies = []
-                    for dep in data.get('requiredMods', []):
-                        if isinstance(dep, str):
-                            dependencies.append({
-                                'id': dep,
-                                'version': '*',
-                                'required': True
-                            })
-                    
-                    return ModInfo(
-                        mod_id=data.get('modid', 'unknown'),
-                        name=data.get('name', jar_path.stem),
-                        version=data.get('version', 'unknown'),
-                        loader='forge',
-                        minecraft_version=self._parse_mc_version(data.get('mcversion', '*')),
-                        dependencies=dependencies,
-                        file_path=str(jar_path)
-                    )
+                if self._has_file(zip_file, 'META-INF/mods.toml'):
+                    return self._parse_forge_toml(zip_file, jar_path)
+                elif self._has_file(zip_file, 'mcmod.info'):
+                    return self._parse_forge_legacy(zip_file, jar_path)
+        except Exception as e:
+            pass
+        return None
+    
+    @staticmethod
+    def _has_file(zip_file: zipfile.ZipFile, name: str) -> bool:
+        """Check for an entry via the zip's name index instead of building namelist()"""
+        try:
+            zip_file.getinfo(name)
+            return True
+        except KeyError:
+            return False
+    
+    def _parse_fabric_mod(self, zip_file: zipfile.ZipFile, jar_path: Path) -> Optional[ModInfo]:
+        """Parse fabric.mod.json from an open jar"""
+        try:
+            with zip_file.open('fabric.mod.json') as f:
+                data = _json_loads(f.read())
+            
+            dependencies = []
+            deps_data = data.get('depends', {})
+            deps_data.update(data.get('requires', {}))
+            
+            for dep_id, version in deps_data.items():
+                if dep_id in ['java']:
+                    continue
+                dependencies.append({
+                    'id': dep_id,
+                    'version': version if isinstance(version, str) else str(version),
+                    'required': True
+                })
+            
+            for dep_id, version in data.get('recommends', {}).items():
+                dependencies.append({
+                    'id': dep_id,
+                    'version': version if isinstance(version, str) else str(version),
+                    'required': False
+                })
+            
+            mc_versions = self._parse_mc_version(deps_data.get('minecraft', '*'))
+            
+            return ModInfo(
+                mod_id=data.get('id', 'unknown'),
+                name=data.get('name', jar_path.stem),
+                version=data.get('version', 'unknown'),
+                loader='fabric',
+                minecraft_version=mc_versions,
+                dependencies=dependencies,
+                file_path=str(jar_path)
+            )
+        except Exception as e:
+            pass
+        return None
+    
+    def _parse_forge_toml(self, zip_file: zipfile.ZipFile, jar_path: Path) -> Optional[ModInfo]:
+        """Parse META-INF/mods.toml from an open jar"""
+        try:
+            with zip_file.open('META-INF/mods.toml') as f:
+                if not TOMLI_AVAILABLE:
+                    return self._parse_forge_toml_manual(f.read().decode('utf-8'), jar_path)
+                data = _toml.load(f)
+            
+            mods_list = data.get('mods', [])
+            if not mods_list:
+                return None
+            
+            mod_data = mods_list[0]
+            mod_id = mod_data.get('modId', 'unknown')
+            
+            dependencies = []
+            for dep in data.get('dependencies', {}).get(mod_id, []):
+                if dep.get('modId') in ['forge', 'java']:
+                    continue
+                dependencies.append({
+                    'id': dep.get('modId', 'unknown'),
+                    'version': dep.get('versionRange', '*'),
+                    'required': dep.get('mandatory', True)
+                })
+            
+            mc_version = self._get_forge_mc_version(data)
+            
+            return ModInfo(
+                mod_id=mod_id,
+                name=mod_data.get('displayName', jar_path.stem),
+                version=mod_data.get('version', 'unknown'),
+                loader='forge',
+                minecraft_version=self._parse_mc_version(mc_version),
+                dependencies=dependencies,
+                file_path=str(jar_path)
+            )
+        except Exception as e:
+            pass
+        return None
+    
+    def _parse_forge_legacy(self, zip_file: zipfile.ZipFile, jar_path: Path) -> Optional[ModInfo]:
+        """Parse mcmod.info from an open jar"""
+        try:
+            with zip_file.open('mcmod.info') as f:
+                content = f.read().decode('utf-8')
+                # Handle malformed JSON
+                content = re.sub(r',\s*}', '}', content)
+                content = re.sub(r',\s*]', ']', content)
+                data = _json_loads(content)
+            
+            if isinstance(data, list):
+                data = data[0] if data else {}
+            elif isinstance(data, dict) and 'modList' in data:
+                data = data['modList'][0] if data['modList'] else {}
+            
+            dependencies = []
+            for dep in data.get('requiredMods', []):
+                if isinstance(dep, str):
+                    dependencies.append({
+                        'id': dep,
+                        'version': '*',
+                        'required': True
+                    })
+            
+            return ModInfo(
+                mod_id=data.get('modid', 'unknown'),
+                name=data.get('name', jar_path.stem),
+                version=data.get('version', 'unknown'),
+                loader='forge',
+                minecraft_version=self._parse_mc_version(data.get('mcversion', '*')),
+                dependencies=dependencies,
+                file_path=str(jar_path)
+            )
         except Exception as e:
             pass
         return None
     
     def _parse_forge_toml_manual(self, content: str, jar_path: Path) -> Optional[ModInfo]:
-        """Fallback TOML parser"""
+        """Fallback TOML parser, used only when neither tomllib nor tomli is available"""
         try:
-            mod_id = re.search(r'modId\s*=\s*["\']([^"\']+)["\']', content)
-            name = re.search(r'displayName\s*=\s*["\']([^"\']+)["\']', content)
-            version = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
+            fields = {}
+            for match in self._TOML_FALLBACK.finditer(content):
+                fields.setdefault(match['key'], match['val'])
             
             return ModInfo(
-                mod_id=mod_id.group(1) if mod_id else 'unknown',
-                name=name.group(1) if name else jar_path.stem,
-                version=version.group(1) if version else 'unknown',
+                mod_id=fields.get('modId', 'unknown'),
+                name=fields.get('displayName', jar_path.stem),
+                version=fields.get('version', 'unknown'),
                 loader='forge',
                 minecraft_version=['*'],
                 dependencies=[],
@@ -327,6 +748,37 @@ class DependencyChecker:
         versions = re.findall(r'\d+\.\d+(?:\.\d+)?', str(version_str))
         return versions if versions else ['*']
     
+    @staticmethod
+    def _index_key(jar_path: Path) -> Optional[str]:
+        """Key a jar by path, size and modification time, None if it can't be read"""
+        try:
+            stat = jar_path.stat()
+            return f"{jar_path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        except OSError:
+            return None
+    
+    def _load_mod_index(self) -> Dict[str, Optional[Dict]]:
+        """Load parsed mod metadata from previous runs"""
+        try:
+            with open(self.INDEX_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == __version__ and isinstance(data['mods'], dict):
+                return data['mods']
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+    
+    def _save_mod_index(self, index: Dict[str, Optional[Dict]], current_keys: List[str]):
+        """Save the mod index, dropping entries for changed or deleted jars"""
+        current = set(current_keys)
+        scanned_paths = {key.rsplit(':', 2)[0] for key in current_keys}
+        mods = {}
+        for key, entry in index.items():
+            path = key.rsplit(':', 2)[0]
+            if key in current or (path not in scanned_paths and os.path.exists(path)):
+                mods[key] = entry
+        _write_json_atomic(self.INDEX_FILE, {'version': __version__, 'mods': mods})
+    
     def scan_mods_folder(self, folder_path: Path) -> List[ModInfo]:
         """Scan mods folder"""
         mods = []
@@ -338,87 +790,233 @@ class DependencyChecker:
         jar_files = list(folder_path.glob("*.jar"))
         print(f"📁 Scanning {len(jar_files)} mod files...")
         
-        loader_count = {'fabric': 0, 'forge': 0}
-        mc_version_count = defaultdict(int)
+        index = self._load_mod_index() if self.use_index else {}
+        # Dangling links and jars deleted since the glob are skipped like unreadable mods
+        keyed = [(jar_file, self._index_key(jar_file)) for jar_file in jar_files]
+        jar_files = [jar_file for jar_file, key in keyed if key]
+        keys = [key for _, key in keyed if key]
+        cached = {}
+        for jar_file, key in zip(jar_files, keys):
+            if key not in index:
+                continue
+            try:
+                # The stored path may be relative to another working directory
+                cached[jar_file] = ModInfo(**{**index[key], 'file_path': str(jar_file)}) if index[key] is not None else None
+            except TypeError:
+                # Entry does not match ModInfo's fields, re-read the jar
+                pass
+        to_read = [jar_file for jar_file in jar_files if jar_file not in cached]
         
-        for jar_file in jar_files:
-            mod_info = self.read_fabric_mod(jar_file) or self.read_forge_mod(jar_file)
-            
-            if mod_info:
-                mods.append(mod_info)
-                self.mod_cache[mod_info.mod_id] = mod_info
-                loader_count[mod_info.loader] += 1
-                
-                for v in mod_info.minecraft_version:
-                    if v != '*':
-                        mc_version_count[v] += 1
+        # Jar reads are IO-bound and independent, so parse them in parallel
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed = dict(zip(to_read, executor.map(self.read_mod, to_read)))
+        
+        results = []
+        for jar_file, key in zip(jar_files, keys):
+            if jar_file in parsed:
+                mod_info = parsed[jar_file]
+                index[key] = asdict(mod_info) if mod_info else None
+            else:
+                mod_info = cached[jar_file]
+            results.append(mod_info)
+        
+        if self.use_index and to_read:
+            self._save_mod_index(index, keys)
+        
+        mods = [mod_info for mod_info in results if mod_info]
+        self.detect_environment(mods)
+        return mods
+    
+    def detect_environment(self, mods: List[ModInfo]):
+        """Detect the most common loader and MC version of a set of mods"""
+        # Seeded so that ties keep preferring Fabric
+        loader_count = Counter({'fabric': 0, 'forge': 0})
+        mc_version_count = Counter()
+        
+        self.mod_cache.update((mod_info.mod_id, mod_info) for mod_info in mods)
+        loader_count.update(mod_info.loader for mod_info in mods)
+        mc_version_count.update(v for mod_info in mods for v in mod_info.minecraft_version if v != '*')
         
         # Detect most common loader and MC version
-        self.loader_type = max(loader_count, key=lambda k: loader_count[k]) if mods else None
-        self.minecraft_version = max(mc_version_count, key=lambda v: mc_version_count[v]) if mc_version_count else None
+        self.loader_type = loader_count.most_common(1)[0][0] if mods else None
+        self.minecraft_version = mc_version_count.most_common(1)[0][0] if mc_version_count else None
         
         if self.minecraft_version:
             print(f"🎮 Detected Minecraft version: {self.minecraft_version}")
         if self.loader_type:
             print(f"🔧 Detected loader: {self.loader_type.upper()}")
-        
-        return mods
     
     def check_dependencies(self, mods: List[ModInfo]) -> Dict[str, List[Dict]]:
         """Check for missing dependencies with download links"""
         installed_ids = {mod.mod_id for mod in mods}
         missing_deps = defaultdict(list)
         
+        pending = []
         for mod in mods:
             for dep in mod.dependencies:
                 if dep['required'] and dep['id'] not in installed_ids:
                     if dep['id'] not in ['fabricloader', 'fabric', 'forge', 'minecraft']:
-                        # Get download info
-                        download_info = None
-                        if REQUESTS_AVAILABLE and self.minecraft_version and self.loader_type:
-                            download_info = ModrinthAPI.get_best_version(
-                                dep['id'], 
-                                self.minecraft_version, 
-                                self.loader_type
-                            )
-                        
-                        missing_deps[mod.mod_id].append({
-                            **dep,
-                            'download_info': download_info
-                        })
+                        pending.append((mod.mod_id, dep))
+        
+        # Look up each dependency once, however many mods require it
+        needed = list(dict.fromkeys(dep['id'] for _, dep in pending))
+        resolved = {}
+        transitive = {}
+        if needed and (REQUESTS_AVAILABLE or AIOHTTP_AVAILABLE) and self.minecraft_version and self.loader_type:
+            resolved, transitive = self._resolve_dependencies(needed, installed_ids, mods)
+        
+        for mod_id, dep in pending:
+            missing_deps[mod_id].append({
+                **dep,
+                'download_info': resolved.get(dep['id'])
+            })
+        
+        # Mods the missing dependencies need in turn
+        for parent_id, deps in transitive.items():
+            missing_deps[parent_id].extend(deps)
         
         return missing_deps
     
+    def _resolve_dependencies(self, dep_ids: List[str], installed_ids: Set[str],
+                              mods: List[ModInfo]) -> Tuple[Dict[str, Optional[Dict]], Dict[str, List[Dict]]]:
+        """Get download info for missing dependencies and what they require
+        
+        Resolution runs one layer at a time. Each layer is looked up
+        concurrently, and the required projects of its versions that are
+        neither installed nor already known form the next layer. Required
+        projects that Modrinth cannot find are left out.
+        """
+        resolved = self._resolve_layer(dep_ids)
+        transitive = defaultdict(list)
+        known = set(dep_ids) | {info['project_id'] for info in resolved.values() if info and info.get('project_id')}
+        layer = [(dep_id, resolved.get(dep_id)) for dep_id in dep_ids]
+        installed_projects = None
+        
+        while layer:
+            requested = defaultdict(list)
+            for name, info in layer:
+                for project_id in (info or {}).get('required_project_ids', []):
+                    if project_id not in known:
+                        requested[project_id].append(name)
+            known.update(requested)
+            if requested and installed_projects is None:
+                installed_projects = self._installed_project_ids(installed_ids, mods)
+            requested = {
+                project_id: parents for project_id, parents in requested.items()
+                if project_id not in installed_projects
+            }
+            # These are exact project IDs, so only look them up directly. A
+            # search for an opaque ID would match an unrelated project
+            found = ModrinthAPI.bulk_get_best_versions(list(requested), self.minecraft_version, self.loader_type) if requested else {}
+            
+            layer = []
+            for project_id, parents in requested.items():
+                info = found.get(project_id)
+                if not info:
+                    continue
+                name = info.get('slug') or project_id
+                if name in installed_ids:
+                    continue
+                for parent in parents:
+                    transitive[parent].append({
+                        'id': name,
+                        'version': '*',
+                        'required': True,
+                        'download_info': info
+                    })
+                layer.append((name, info))
+        
+        return resolved, transitive
+    
+    def _installed_project_ids(self, installed_ids: Set[str], mods: List[ModInfo]) -> Set[str]:
+        """Get the Modrinth project IDs of the installed mods
+        
+        Required projects are listed by project ID, and a mod ID need not
+        match its project's slug (architectury vs architectury-api). Jars
+        are matched exactly by file hash, and mod IDs that are a project
+        ID or slug count as well.
+        """
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hashes = [h for h in executor.map(self._file_sha1, [Path(mod.file_path) for mod in mods]) if h]
+        
+        versions = ModrinthAPI.get_versions_from_hashes(hashes)
+        projects = ModrinthAPI.get_projects(sorted(installed_ids))
+        return ({version.get('project_id') for version in versions.values()}
+                | {project.get('id') for project in projects.values()})
+    
+    @staticmethod
+    def _file_sha1(jar_path: Path) -> Optional[str]:
+        """Hash a jar, None if it is not on disk (e.g. an uploaded stream)"""
+        try:
+            with open(jar_path, 'rb') as f:
+                return hashlib.file_digest(f, 'sha1').hexdigest()
+        except OSError:
+            return None
+    
+    def _resolve_layer(self, dep_ids: List[str]) -> Dict[str, Optional[Dict]]:
+        """Get download info for unique dependency IDs"""
+        # Resolve IDs that match Modrinth projects in bulk, then search for the rest concurrently
+        resolved = ModrinthAPI.bulk_get_best_versions(dep_ids, self.minecraft_version, self.loader_type)
+        unresolved = [dep_id for dep_id in dep_ids if dep_id not in resolved]
+        if unresolved:
+            searched = ModrinthAPI.get_best_versions(unresolved, self.minecraft_version, self.loader_type)
+            resolved.update(zip(unresolved, searched))
+        return resolved
+    
     def create_dependency_tree(self, mods: List[ModInfo]) -> str:
         """Create dependency tree"""
-        lines = []
-        lines.append("\n📦 DEPENDENCY TREE")
-        lines.append("=" * 80)
+        out = io.StringIO()
+        out.write("\n📦 DEPENDENCY TREE\n")
+        out.write("=" * 80)
         
         installed_ids = {mod.mod_id for mod in mods}
         
-        for mod in sorted(mods, key=lambda m: m.name):
-            lines.append(f"\n📘 {mod.name} ({mod.mod_id}) v{mod.version}")
-            lines.append(f"   Loader: {mod.loader.upper()} | MC: {', '.join(mod.minecraft_version)}")
-            lines.append(f"   File: {Path(mod.file_path).name}")
+        for mod in sorted(mods, key=attrgetter('name')):
+            out.write(f"\n\n📘 {mod.name} ({mod.mod_id}) v{mod.version}"
+                      f"\n   Loader: {mod.loader.upper()} | MC: {', '.join(mod.minecraft_version)}"
+                      f"\n   File: {Path(mod.file_path).name}")
             
             if mod.dependencies:
-                lines.append("   Dependencies:")
+                out.write("\n   Dependencies:")
                 for dep in mod.dependencies:
                     if dep['id'] in ['minecraft', 'fabricloader', 'forge']:
                         continue
                     status = "✅" if dep['id'] in installed_ids else "❌"
                     req = "REQUIRED" if dep['required'] else "optional"
-                    lines.append(f"      {status} {dep['id']} {dep['version']} ({req})")
+                    out.write(f"\n      {status} {dep['id']} {dep['version']} ({req})")
             else:
-                lines.append("   Dependencies: None")
+                out.write("\n   Dependencies: None")
         
-        return '\n'.join(lines)
+        return out.getvalue()
 
 
 class ModErrorAnalyzer:
     """Analyze crash logs for mod errors"""
     
+    # Lines holding one of these words are the only places where a pattern
+    # that spells the word out can match, so one scan for them narrows the
+    # log down for every such pattern
+    _KEYWORDS = re.compile(
+        r'requires|missing|depends on mod|duplicate|mixin|ClassNotFoundException|NoClassDefFoundError',
+        re.IGNORECASE
+    )
+    # Rest of a keyword line plus the next line that holds more than colons
+    # and whitespace, which patterns ending in [:\s]+(\S+) can run on to
+    _SEGMENT_TAIL = re.compile(r'[^\n]*(?:\n[:\s]*[^\n]*)?')
+    # Byte versions that find at least the same segments in UTF-8 text: str
+    # IGNORECASE also folds İ and ı to i and ſ to s, and str \s also covers
+    # \x1c-\x1f and non-ASCII spaces, so treat any non-ASCII byte as one
+    _KEYWORDS_BYTES = re.compile(
+        _KEYWORDS.pattern.encode('utf-8').replace(b'i', b'(?:i|\xc4[\xb0\xb1])').replace(b's', b'(?:s|\xc5\xbf)'),
+        re.IGNORECASE
+    )
+    # Lines end at \n, \r\n or a lone \r, as when the log is read in text mode
+    _SEGMENT_TAIL_BYTES = re.compile(rb'[^\r\n]*(?:(?:\r\n?|\n)[:\s\x1c-\x1f\x80-\xff]*[^\r\n]*)?')
+    # File extension and anything that isn't part of a mod ID
+    _NAME_STRIP = re.compile(r'\.(?:jar|json)$|[^\w\-]')
+    
     def __init__(self):
         self.error_patterns = {
             'missing_dependency': {
@@ -473,36 +1071,100 @@ class ModErrorAnalyzer:
                 'solution': 'Use the correct mod loader version'
             },
         }
+        self._compiled = {
+            error_type: [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in data['patterns']]
+            for error_type, data in self.error_patterns.items()
+        }
+        # Patterns without a keyword could match outside the keyword lines,
+        # run those over the whole log instead
+        self._full_scan = {
+            (error_type, i)
+            for error_type, data in self.error_patterns.items()
+            for i, p in enumerate(data['patterns'])
+            if not self._KEYWORDS.search(p)
+        }
     
     def analyze_log(self, log_content: str) -> List[Dict]:
         """Analyze log and find issues"""
+        segments = self._find_segments(log_content, self._KEYWORDS, self._SEGMENT_TAIL, ('\n',))
+        spans = [(log_content, start, end) for start, end in segments]
+        return self._collect_issues(spans, lambda: [(log_content, 0, len(log_content))])
+    
+    def analyze_log_bytes(self, log_content: bytes) -> List[Dict]:
+        """Analyze a UTF-8 log without decoding all of it
+        
+        Accepts any bytes-like object, including an mmap of the log file.
+        Only the keyword segments are decoded, the patterns themselves run
+        on text so the results match analyze_log on the log read in text
+        mode, with \r\n and lone \r line breaks turned into \n.
+        """
+        segments = self._find_segments(log_content, self._KEYWORDS_BYTES, self._SEGMENT_TAIL_BYTES, (b'\n', b'\r'))
+        texts = [self._decode(log_content[start:end]) for start, end in segments]
+        spans = [(text, 0, len(text)) for text in texts]
+        
+        def whole_log():
+            text = self._decode(log_content)
+            return [(text, 0, len(text))]
+        
+        return self._collect_issues(spans, whole_log)
+    
+    def _collect_issues(self, segments: List[Tuple[str, int, int]], whole_log) -> List[Dict]:
+        """Run the error patterns over the candidate segments
+        
+        whole_log is only called when a pattern needs the full log.
+        """
         issues = []
         seen = set()
+        full = None
         
-        for error_type, data in self.error_patterns.items():
-            for pattern in data['patterns']:
-                for match in re.finditer(pattern, log_content, re.IGNORECASE | re.MULTILINE):
-                    mod_name = self._clean_name(match.groups()[0] if match.groups() else "Unknown")
-                    issue_id = f"{error_type}:{mod_name}"
-                    
-                    if issue_id not in seen:
-                        seen.add(issue_id)
-                        issues.append({
-                            'error_type': error_type,
-                            'mod_name': mod_name,
-                            'reason': data['reason'],
-                            'solution': data['solution'],
-                            'context': match.group(0)[:200],
-                            'additional': list(match.groups()[1:]) if len(match.groups()) > 1 else []
-                        })
+        for error_type, patterns in self._compiled.items():
+            data = self.error_patterns[error_type]
+            for i, pattern in enumerate(patterns):
+                if (error_type, i) in self._full_scan:
+                    full = full or whole_log()
+                    spans = full
+                else:
+                    spans = segments
+                for text, start, end in spans:
+                    for match in pattern.finditer(text, start, end):
+                        groups = match.groups()
+                        mod_name = self._clean_name(groups[0] if groups else "Unknown")
+                        issue_id = f"{error_type}:{mod_name}"
+                        
+                        if issue_id not in seen:
+                            seen.add(issue_id)
+                            issues.append({
+                                'error_type': error_type,
+                                'mod_name': mod_name,
+                                'reason': data['reason'],
+                                'solution': data['solution'],
+                                'context': match.group(0)[:200],
+                                'additional': list(groups[1:])
+                            })
         
         return issues
     
+    @staticmethod
+    def _decode(data) -> str:
+        """Decode UTF-8 log bytes with universal newlines"""
+        return str(data, 'utf-8', 'ignore').replace('\r\n', '\n').replace('\r', '\n')
+    
+    def _find_segments(self, log_content, keywords: re.Pattern, tail: re.Pattern, newlines: Tuple) -> List[Tuple[int, int]]:
+        """Find the spans of the log that can contain an error, in one pass"""
+        segments = []
+        for match in keywords.finditer(log_content):
+            start = max(log_content.rfind(newline, 0, match.start()) for newline in newlines) + 1
+            end = tail.match(log_content, match.end()).end()
+            if segments and start <= segments[-1][1]:
+                segments[-1] = (segments[-1][0], max(segments[-1][1], end))
+            else:
+                segments.append((start, end))
+        return segments
+    
     def _clean_name(self, name: str) -> str:
         """Clean mod name"""
-        name = re.sub(r'\.(jar|json)$', '', name)
-        name = re.sub(r'^.*[\\/]', '', name)
-        name = re.sub(r'[^\w\-]', '', name)
+        name = name.rpartition('/')[2].rpartition('\\')[2]
+        name = self._NAME_STRIP.sub('', name)
         return name or "Unknown"
     
     def format_report(self, issues: List[Dict], missing_deps: Optional[Dict] = None, 
@@ -591,6 +1253,8 @@ Examples:
     parser.add_argument('-f', '--find-missing', action='store_true', help='Find missing dependencies')
     parser.add_argument('-d', '--deps-only', action='store_true', help='Show dependency tree only')
     parser.add_argument('-o', '--output', help='Output file for report')
+    parser.add_argument('--cache-ttl', type=int, default=ModrinthAPI.CACHE_TTL,
+                        help='Seconds to cache Modrinth responses (default: 86400, 0 disables)')
     parser.add_argument('-v', '--version', action='version', version=f'mod2fix {__version__}')
     
     args = parser.parse_args()
@@ -605,6 +1269,8 @@ Examples:
     if not TOMLI_AVAILABLE:
         print("\n⚠️  Install 'tomli' for Forge mod support: pip install tomli")
     
+    ModrinthAPI.CACHE_TTL = args.cache_ttl
+    
     analyzer = ModErrorAnalyzer()
     dep_checker = DependencyChecker()
     
@@ -635,10 +1301,19 @@ Examples:
             sys.exit(1)
         
         print(f"📂 Analyzing: {log_path}\n")
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            log_content = f.read()
-        
-        issues = analyzer.analyze_log(log_content)
+        with open(log_path, 'rb') as f:
+            # Map the log instead of reading it so huge logs aren't copied into memory
+            try:
+                log_content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files and pipes can't be mapped
+                log_content = f.read()
+            
+            try:
+                issues = analyzer.analyze_log_bytes(log_content)
+            finally:
+                if isinstance(log_content, mmap.mmap):
+                    log_content.close()
     
     # Generate report
     report = analyzer.format_report(
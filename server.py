@@ -1,26 +1,44 @@
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, abort
 try:
     from flask_cors import CORS
 except Exception:
     # Fallback no-op CORS if flask_cors is not installed
     def CORS(app, *args, **kwargs):
         return app
-import tempfile
-from pathlib import Path
 from dataclasses import asdict
 import mod2fix
 
+MAX_UPLOAD_MB = 64
+
 app = Flask(__name__)
 CORS(app)
 
+# Patterns are compiled once and shared by all requests
+analyzer = mod2fix.ModErrorAnalyzer()
+
+@app.errorhandler(413)
+def upload_too_large(error):
+    """Report oversized uploads as JSON"""
+    return jsonify({
+        'success': False,
+        'error': f'Upload exceeds {MAX_UPLOAD_MB}MB'
+    }), 413
+
 @app.route('/api/analyze', methods=['POST'])
 def analyze_log():
     """Analyze crash log"""
-    data = request.get_json(silent=True) or {}
-    log_content = data.get('log_content', '')
+    # Reject oversized logs before the body is parsed. Only this route is
+    # capped, mod uploads can add up to far more than one log
+    if (request.content_length or 0) > MAX_UPLOAD_MB * 1024 * 1024:
+        abort(413)
     
-    analyzer = mod2fix.ModErrorAnalyzer()
-    issues = analyzer.analyze_log(log_content)
+    log_file = request.files.get('log')
+    if log_file:
+        # Multipart uploads are scanned as raw bytes, without decoding the whole log
+        issues = analyzer.analyze_log_bytes(log_file.stream.read())
+    else:
+        data = request.get_json(silent=True) or {}
+        issues = analyzer.analyze_log(data.get('log_content', ''))
     
     return jsonify({
         'success': True,
@@ -33,27 +51,29 @@ def scan_mods():
     # Handle uploaded mod files
     files = request.files.getlist('mods')
     
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-        
-        # Save uploaded files
-        for file in files:
-            filename = getattr(file, 'filename', '') or ''
-            if filename.lower().endswith('.jar'):
-                file.save(tmp_path/filename)
-        
-        # Scan
-        dep_checker = mod2fix.DependencyChecker()
-        mods = dep_checker.scan_mods_folder(tmp_path)
-        missing = dep_checker.check_dependencies(mods)
-        
-        return jsonify({
-            'success': True,
-            'mods': [asdict(mod) for mod in mods],
-            'missing_dependencies': missing,
-            'minecraft_version': dep_checker.minecraft_version,
-            'loader': dep_checker.loader_type
-        })
+    # Read each upload in place instead of copying it to a temp dir first
+    dep_checker = mod2fix.DependencyChecker()
+    mods = []
+    for file in files:
+        filename = getattr(file, 'filename', '') or ''
+        if filename.lower().endswith('.jar'):
+            mod_info = dep_checker.read_mod_from_stream(file.stream, filename)
+            if mod_info:
+                mods.append(mod_info)
+    
+    # Scan
+    dep_checker.detect_environment(mods)
+    missing = dep_checker.check_dependencies(mods)
+    
+    return jsonify({
+        'success': True,
+        'mods': [asdict(mod) for mod in mods],
+        'missing_dependencies': missing,
+        'minecraft_version': dep_checker.minecraft_version,
+        'loader': dep_checker.loader_type
+    })
 
 if __name__ == '__main__':
+    # Development server only. For production run several workers, e.g.
+    # gunicorn -w 4 --worker-class gthread server:app
     app.run(debug=True, port=5000)
\ No newline at end of file
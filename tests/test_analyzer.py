@@ -0,0 +1,127 @@
+"""Tests for ModErrorAnalyzer"""
+
+import random
+import re
+
+import pytest
+
+from mod2fix import ModErrorAnalyzer
+
+SAMPLE_LOG = """\
+[12:00:01] [main/INFO]: Loading 42 mods
+[12:00:02] [main/ERROR]: Incompatible mod set!
+Unmet dependency listing:
+	 - Mod 'Mod Menu' (modmenu) 7.2.2 requires mod fabric-api, which is missing!
+	 - Mod sodium requires fabricloader 0.15.0
+Missing required mod: cloth-config
+[12:00:03] [main/WARN]: Duplicate mods:
+	mods/jei-1.20.1.jar
+[12:00:04] [main/ERROR]: Mixin apply failed sodium.mixins.json:MixinWorldRenderer
+java.lang.NoClassDefFoundError: net/minecraft/client/Foo
+Caused by: java.lang.ClassNotFoundException: dev.architectury.Platform
+Mod create requires Forge
+Mod examplemod requires Minecraft version: 1.20.2
+"""
+
+TOKENS = [
+    'Mod', 'mod', 'requires', 'REQUIRES', 'version', 'Minecraft', 'Missing', 'required',
+    'dependency:', 'Duplicate', 'mods:', ':', '::', '\n', '\n\n', ' \n ', '  ', 'Found',
+    'duplicate', 'Mixin', 'failed', 'ERROR', '```math', '```', 'ClassNotFoundException:',
+    'NoClassDefFoundError:', 'Forge', 'Fabric', 'Quilt', 'depends on', 'a.jar', 'x/y.json',
+    'é', 'foo', 'bar', '1.20.1', '\t', 'Unmet dependency listing', '\r\n',
+]
+
+
+def full_scan(analyzer: ModErrorAnalyzer, log_content: str):
+    """Run every pattern over the whole log, the way analyze_log did before prefiltering"""
+    issues = []
+    seen = set()
+    for error_type, data in analyzer.error_patterns.items():
+        for pattern in data['patterns']:
+            for match in re.finditer(pattern, log_content, re.IGNORECASE | re.MULTILINE):
+                mod_name = analyzer._clean_name(match.groups()[0] if match.groups() else "Unknown")
+                issue_id = f"{error_type}:{mod_name}"
+                if issue_id not in seen:
+                    seen.add(issue_id)
+                    issues.append({
+                        'error_type': error_type,
+                        'mod_name': mod_name,
+                        'reason': data['reason'],
+                        'solution': data['solution'],
+                        'context': match.group(0)[:200],
+                        'additional': list(match.groups()[1:]),
+                    })
+    return issues
+
+
+def text_mode(log_content: str) -> str:
+    """Line breaks as reading the log in text mode leaves them"""
+    return log_content.replace('\r\n', '\n').replace('\r', '\n')
+
+
+def random_logs(seed: int, count: int = 500):
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield ' '.join(rng.choice(TOKENS) for _ in range(rng.randint(1, 60)))
+
+
+def test_every_pattern_contains_a_keyword():
+    analyzer = ModErrorAnalyzer()
+    for data in analyzer.error_patterns.values():
+        for pattern in data['patterns']:
+            assert analyzer._KEYWORDS.search(pattern), pattern
+
+
+def test_sample_log_matches_full_scan():
+    analyzer = ModErrorAnalyzer()
+    issues = analyzer.analyze_log(SAMPLE_LOG)
+    assert issues
+    assert issues == full_scan(analyzer, SAMPLE_LOG)
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_random_logs_match_full_scan(seed):
+    analyzer = ModErrorAnalyzer()
+    for log in random_logs(seed):
+        assert analyzer.analyze_log(log) == full_scan(analyzer, log), log
+
+
+def test_patterns_without_keyword_scan_whole_log(monkeypatch):
+    # Narrow the keywords so most patterns no longer spell one out
+    monkeypatch.setattr(ModErrorAnalyzer, '_KEYWORDS', re.compile('missing', re.IGNORECASE))
+    analyzer = ModErrorAnalyzer()
+    assert analyzer._full_scan
+    assert analyzer.analyze_log(SAMPLE_LOG) == full_scan(analyzer, SAMPLE_LOG)
+    for log in random_logs(0, 200):
+        assert analyzer.analyze_log(log) == full_scan(analyzer, log), log
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_bytes_match_str_on_unicode_logs(seed):
+    analyzer = ModErrorAnalyzer()
+    unicode_tokens = ['\r', 'caf\u00e9', '\u00a0', '\u3000', '\u2028', '\x85', '\x1c', '\u017f', 'm\u0131xin', '\u0130', 'requ\u0131re\u017f']
+    rng = random.Random(seed)
+    for _ in range(500):
+        log = ' '.join(rng.choice(TOKENS + unicode_tokens) for _ in range(rng.randint(1, 60)))
+        assert analyzer.analyze_log_bytes(log.encode('utf-8')) == analyzer.analyze_log(text_mode(log)), log
+
+
+def test_bytes_decode_non_ascii_names():
+    analyzer = ModErrorAnalyzer()
+    log = "Missing mod: caf\u00e9\u00a0next\nDuplicate mods:\n\u3000\njei.jar\n"
+    issues = analyzer.analyze_log_bytes(log.encode('utf-8'))
+    assert issues == analyzer.analyze_log(log)
+    assert [issue['mod_name'] for issue in issues] == ['caf\u00e9', 'jei']
+
+
+@pytest.mark.parametrize('line_break', [b'\r', b'\r\n', b'\n'])
+def test_bytes_match_text_mode_read(tmp_path, line_break):
+    analyzer = ModErrorAnalyzer()
+    log_file = tmp_path / 'latest.log'
+    log_file.write_bytes(b'Mixin failed' + line_break + b'foo bar' + line_break + b'Missing mod: sodium')
+    with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+        expected = analyzer.analyze_log(f.read())
+
+    issues = analyzer.analyze_log_bytes(log_file.read_bytes())
+    assert issues == expected
+    assert [(issue['error_type'], issue['mod_name']) for issue in issues] == [('missing_dependency', 'sodium')]
@@ -0,0 +1,153 @@
+"""Tests for DependencyChecker"""
+
+import hashlib
+import json
+import zipfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import mod2fix
+from mod2fix import DependencyChecker
+
+
+def make_jar(folder: Path, mod_id: str, depends=None) -> Path:
+    """Build a minimal Fabric mod jar"""
+    jar_path = folder / f"{mod_id}.jar"
+    metadata = {
+        'id': mod_id,
+        'name': mod_id.title(),
+        'version': '1.0.0',
+        'depends': {'minecraft': '1.20.1', **(depends or {})},
+    }
+    with zipfile.ZipFile(jar_path, 'w') as zf:
+        zf.writestr('fabric.mod.json', json.dumps(metadata))
+    return jar_path
+
+
+@pytest.fixture
+def checker(tmp_path, monkeypatch):
+    checker = DependencyChecker()
+    monkeypatch.setattr(checker, 'INDEX_FILE', tmp_path / 'mods_index.json')
+    return checker
+
+
+@pytest.fixture
+def mods_folder(tmp_path):
+    folder = tmp_path / 'mods'
+    folder.mkdir()
+    make_jar(folder, 'sodium')
+    make_jar(folder, 'modmenu', {'fabric-api': '*'})
+    return folder
+
+
+def test_index_hit_uses_current_jar_path(checker, mods_folder, monkeypatch):
+    monkeypatch.chdir(mods_folder.parent)
+    first = checker.scan_mods_folder(Path('mods'))
+    assert all(not Path(mod.file_path).is_absolute() for mod in first)
+
+    monkeypatch.chdir(mods_folder)
+    second = checker.scan_mods_folder(mods_folder)
+    assert sorted(mod.file_path for mod in second) == sorted(str(p) for p in mods_folder.glob('*.jar'))
+
+
+def test_index_entry_with_unknown_fields_is_a_miss(checker, mods_folder):
+    checker.scan_mods_folder(mods_folder)
+    data = json.loads(checker.INDEX_FILE.read_text())
+    for entry in data['mods'].values():
+        entry['stale_field'] = True
+    checker.INDEX_FILE.write_text(json.dumps(data))
+
+    mods = checker.scan_mods_folder(mods_folder)
+    assert sorted(mod.mod_id for mod in mods) == ['modmenu', 'sodium']
+    data = json.loads(checker.INDEX_FILE.read_text())
+    assert all('stale_field' not in entry for entry in data['mods'].values())
+
+
+def installed(mod_id: str, requires=()) -> mod2fix.ModInfo:
+    dependencies = [{'id': dep_id, 'version': '*', 'required': True} for dep_id in requires]
+    return mod2fix.ModInfo(mod_id, mod_id.title(), '1.0.0', 'fabric', ['1.20.1'], dependencies, f"{mod_id}.jar")
+
+
+def test_check_dependencies_sees_appended_mods(checker, mods_folder, monkeypatch):
+    monkeypatch.setattr(checker, '_resolve_dependencies', lambda *args: ({}, {}))
+    mods = checker.scan_mods_folder(mods_folder)
+    assert [dep['id'] for dep in checker.check_dependencies(mods)['modmenu']] == ['fabric-api']
+
+    mods.append(installed('fabric-api'))
+    assert not checker.check_dependencies(mods)
+
+
+def test_dependency_tree_includes_appended_mods(checker, mods_folder):
+    mods = checker.scan_mods_folder(mods_folder)
+    assert "❌ fabric-api" in checker.create_dependency_tree(mods)
+
+    mods.append(installed('fabric-api'))
+    tree = checker.create_dependency_tree(mods)
+    assert "📘 Fabric-Api (fabric-api)" in tree
+    assert "✅ fabric-api" in tree
+
+
+@pytest.fixture
+def modrinth(monkeypatch):
+    """Stand-in for Modrinth where cloth-config requires architectury-api"""
+    infos = {
+        'cloth-config': {'slug': 'cloth-config', 'project_id': '9s6osm5g', 'required_project_ids': ['lhGA9TYQ']},
+        'lhGA9TYQ': {'slug': 'architectury-api', 'project_id': 'lhGA9TYQ', 'required_project_ids': []},
+    }
+    file_versions = {}
+    api = mod2fix.ModrinthAPI
+    monkeypatch.setattr(api, 'bulk_get_best_versions', lambda ids, mc, loader: {i: infos[i] for i in ids if i in infos})
+    monkeypatch.setattr(api, 'get_best_versions', lambda ids, mc, loader: [None] * len(ids))
+    monkeypatch.setattr(api, 'get_projects', lambda ids: {})
+    monkeypatch.setattr(api, 'get_versions_from_hashes', lambda hashes: {h: file_versions[h] for h in hashes if h in file_versions})
+    return SimpleNamespace(infos=infos, file_versions=file_versions)
+
+
+def test_transitive_dependency_reported_by_slug(checker, modrinth):
+    mods = [installed('modmenu', ['cloth-config'])]
+    checker.detect_environment(mods)
+    missing = checker.check_dependencies(mods)
+    assert [dep['id'] for dep in missing['modmenu']] == ['cloth-config']
+    assert [dep['id'] for dep in missing['cloth-config']] == ['architectury-api']
+
+
+def test_transitive_dependency_installed_under_other_mod_id(checker, modrinth, tmp_path):
+    jar_path = make_jar(tmp_path, 'architectury')
+    sha1 = hashlib.sha1(jar_path.read_bytes()).hexdigest()
+    modrinth.file_versions[sha1] = {'id': 'ar1', 'project_id': 'lhGA9TYQ'}
+    mods = [installed('modmenu', ['cloth-config']), checker.read_mod(jar_path)]
+    checker.detect_environment(mods)
+    missing = checker.check_dependencies(mods)
+    assert [dep['id'] for dep in missing['modmenu']] == ['cloth-config']
+    assert 'cloth-config' not in missing
+
+
+def test_unknown_transitive_project_is_not_searched(checker, modrinth, monkeypatch):
+    searched = []
+    monkeypatch.setattr(mod2fix.ModrinthAPI, 'get_best_versions', lambda ids, mc, loader: searched.extend(ids) or [None] * len(ids))
+    modrinth.infos['cloth-config']['required_project_ids'] = ['gone0000']
+    mods = [installed('modmenu', ['cloth-config'])]
+    checker.detect_environment(mods)
+    missing = checker.check_dependencies(mods)
+    assert [dep['id'] for dep in missing['modmenu']] == ['cloth-config']
+    assert 'cloth-config' not in missing
+    assert 'gone0000' not in searched
+
+
+@pytest.mark.parametrize('use_index', [True, False])
+def test_broken_symlink_is_skipped(checker, mods_folder, use_index):
+    (mods_folder / 'gone.jar').symlink_to(mods_folder / 'missing.jar')
+    checker.use_index = use_index
+    mods = checker.scan_mods_folder(mods_folder)
+    assert sorted(mod.mod_id for mod in mods) == ['modmenu', 'sodium']
+
+
+def test_unmatched_installed_mod_does_not_hide_requirement(checker, modrinth, tmp_path, monkeypatch):
+    # No hash or slug match: the installed ID must not be guessed into a project
+    monkeypatch.setattr(mod2fix.ModrinthAPI, 'search_mod', lambda *args: pytest.fail('searched'))
+    mods = [installed('modmenu', ['cloth-config']), checker.read_mod(make_jar(tmp_path, 'architectury'))]
+    checker.detect_environment(mods)
+    missing = checker.check_dependencies(mods)
+    assert [dep['id'] for dep in missing['cloth-config']] == ['architectury-api']
@@ -0,0 +1,202 @@
+"""Tests for ModrinthAPI"""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from mod2fix import ModrinthAPI
+
+URL = "https://api.modrinth.com/v2/search"
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=None):
+        self.status_code = status_code
+        self._body = body
+
+    def json(self):
+        return self._body
+
+
+class FakeSession:
+    """Stand-in for requests.Session that replays canned responses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+        self.payloads = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+    def post(self, url, json=None, timeout=None):
+        self.calls += 1
+        self.payloads.append(json)
+        return self.responses.pop(0)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(ModrinthAPI, '_CACHE_DIR', tmp_path / 'responses')
+    monkeypatch.setattr(ModrinthAPI, '_cache_pruned', False)
+    monkeypatch.setattr(ModrinthAPI, 'CACHE_TTL', 3600)
+    return tmp_path / 'responses'
+
+
+def use_session(monkeypatch, *responses) -> FakeSession:
+    session = FakeSession(*responses)
+    monkeypatch.setattr(ModrinthAPI, '_session', session)
+    return session
+
+
+def test_successful_response_is_served_from_cache(cache_dir, monkeypatch):
+    session = use_session(monkeypatch, FakeResponse(200, {'hits': [1]}))
+    assert ModrinthAPI._cached_get(URL, {'query': 'sodium'}) == (200, {'hits': [1]})
+    assert ModrinthAPI._cached_get(URL, {'query': 'sodium'}) == (200, {'hits': [1]})
+    assert session.calls == 1
+    assert len(list(cache_dir.iterdir())) == 1
+
+
+def test_error_responses_are_not_cached(cache_dir, monkeypatch):
+    session = use_session(monkeypatch, FakeResponse(404), FakeResponse(200, {'hits': []}))
+    assert ModrinthAPI._cached_get(URL, {'query': 'nope'}) == (404, None)
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())
+    assert ModrinthAPI._cached_get(URL, {'query': 'nope'}) == (200, {'hits': []})
+    assert session.calls == 2
+
+
+def test_expired_entry_is_refetched_and_deleted(cache_dir, monkeypatch):
+    session = use_session(monkeypatch, FakeResponse(200, {'v': 1}), FakeResponse(200, {'v': 2}))
+    ModrinthAPI._cached_get(URL)
+    later = time.time() + 7200
+    monkeypatch.setattr(time, 'time', lambda: later)
+    assert ModrinthAPI._cache_read(ModrinthAPI._cache_file(URL)) is None
+    assert not ModrinthAPI._cache_file(URL).exists()
+    assert ModrinthAPI._cached_get(URL) == (200, {'v': 2})
+    assert session.calls == 2
+
+
+def test_zero_ttl_disables_cache(cache_dir, monkeypatch):
+    monkeypatch.setattr(ModrinthAPI, 'CACHE_TTL', 0)
+    session = use_session(monkeypatch, FakeResponse(200, {'v': 1}), FakeResponse(200, {'v': 2}))
+    assert ModrinthAPI._cached_get(URL) == (200, {'v': 1})
+    assert ModrinthAPI._cached_get(URL) == (200, {'v': 2})
+    assert session.calls == 2
+    assert not cache_dir.exists()
+
+
+def test_versions_from_hashes_are_looked_up_in_cached_chunks(cache_dir, monkeypatch):
+    monkeypatch.setattr(ModrinthAPI, 'BULK_CHUNK_SIZE', 2)
+    session = use_session(
+        monkeypatch,
+        FakeResponse(200, {'a': {'project_id': 'P1'}}),
+        FakeResponse(200, {'c': {'project_id': 'P3'}}),
+    )
+    expected = {'a': {'project_id': 'P1'}, 'c': {'project_id': 'P3'}}
+    assert ModrinthAPI.get_versions_from_hashes(['a', 'b', 'c']) == expected
+    assert session.payloads == [
+        {'hashes': ['a', 'b'], 'algorithm': 'sha1'},
+        {'hashes': ['c'], 'algorithm': 'sha1'},
+    ]
+    assert ModrinthAPI.get_versions_from_hashes(['a', 'b', 'c']) == expected
+    assert session.calls == 2
+
+
+def test_prune_removes_expired_entries_and_temp_files(cache_dir):
+    cache_dir.mkdir()
+    old = time.time() - 7200
+    for name in ('expired.json', 'leftover.tmp'):
+        (cache_dir / name).write_text('{}')
+        os.utime(cache_dir / name, (old, old))
+    (cache_dir / 'fresh.json').write_text('{}')
+
+    ModrinthAPI._cache_read(cache_dir / 'missing.json')
+    assert sorted(p.name for p in cache_dir.iterdir()) == ['fresh.json']
+    assert ModrinthAPI._cache_pruned
+
+
+class FakeAsyncResponse:
+    def __init__(self, status, body=None, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self):
+        return self._body
+
+
+class FakeAsyncSession:
+    """Stand-in for aiohttp.ClientSession that replays canned responses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def get(self, url, params=None):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class Sleeps(list):
+    """Backoff delays, with whether the semaphore was held during each"""
+
+    def __init__(self):
+        super().__init__()
+        self.semaphore = asyncio.Semaphore(1)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = Sleeps()
+
+    async def fake_sleep(delay):
+        sleeps.append((delay, sleeps.semaphore.locked()))
+
+    monkeypatch.setattr(asyncio, 'sleep', fake_sleep)
+    return sleeps
+
+
+def get_async(session, semaphore):
+    return asyncio.run(ModrinthAPI._cached_get_async(session, URL, {'query': 'sodium'}, semaphore))
+
+
+def test_rate_limited_request_is_retried(cache_dir, sleeps):
+    session = FakeAsyncSession(
+        FakeAsyncResponse(429, headers={'Retry-After': '2.5'}),
+        FakeAsyncResponse(429),
+        FakeAsyncResponse(200, {'hits': [1]}),
+    )
+    assert get_async(session, sleeps.semaphore) == (200, {'hits': [1]})
+    assert session.calls == 3
+    # Backoff happens with the semaphore released
+    assert sleeps == [(2.5, False), (1.0, False)]
+    assert ModrinthAPI._cache_read(ModrinthAPI._cache_file(URL, {'query': 'sodium'})) == (200, {'hits': [1]})
+
+
+def test_retries_stop_after_max_retries(cache_dir, sleeps, monkeypatch):
+    monkeypatch.setattr(ModrinthAPI, 'MAX_RETRIES', 2)
+    session = FakeAsyncSession(*(FakeAsyncResponse(429, headers={'Retry-After': '0'}) for _ in range(5)))
+    assert get_async(session, sleeps.semaphore) == (429, None)
+    assert session.calls == 3
+    assert len(sleeps) == 2
+    assert not cache_dir.exists() or not list(cache_dir.iterdir())
+
+
+@pytest.mark.parametrize('header, delay', [
+    ('3', 3.0),
+    ('0.5', 0.5),
+    ('-4', 0.0),
+    ('600', 60.0),
+    ('Wed, 21 Oct 2026 07:28:00 GMT', 1.0),
+])
+def test_retry_after_parsing(header, delay):
+    assert ModrinthAPI._retry_delay(header) == delay
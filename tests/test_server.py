@@ -0,0 +1,79 @@
+"""Tests for the Flask API"""
+
+import io
+import json
+import zipfile
+
+import pytest
+
+pytest.importorskip('flask')
+
+import mod2fix  # noqa: E402
+import server  # noqa: E402
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(server, 'MAX_UPLOAD_MB', 1)
+    return server.app.test_client()
+
+
+def test_analyze_rejects_oversized_log(client):
+    log = io.BytesIO(b'x' * (2 * 1024 * 1024))
+    response = client.post('/api/analyze', data={'log': (log, 'latest.log')})
+    assert response.status_code == 413
+    assert response.get_json()['success'] is False
+
+
+def test_scan_mods_is_not_capped(client):
+    upload = io.BytesIO(b'x' * (2 * 1024 * 1024))
+    response = client.post('/api/scan-mods', data={'mods': [(upload, 'big.jar')]})
+    assert response.status_code == 200
+    assert response.get_json()['mods'] == []
+
+
+def jar_bytes(mod_id: str, depends=None) -> io.BytesIO:
+    """Build a minimal Fabric mod jar in memory"""
+    metadata = {'id': mod_id, 'name': mod_id.title(), 'version': '1.0.0',
+                'depends': {'minecraft': '1.20.1', **(depends or {})}}
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w') as zf:
+        zf.writestr('fabric.mod.json', json.dumps(metadata))
+    data.seek(0)
+    return data
+
+
+def test_scan_mods_reads_uploads_in_memory(client, monkeypatch):
+    monkeypatch.setattr(mod2fix.DependencyChecker, '_resolve_dependencies',
+                        lambda self, *args: ({}, {}))
+    response = client.post('/api/scan-mods', data={'mods': [
+        (jar_bytes('modmenu', {'fabric-api': '*'}), 'modmenu.jar'),
+        (io.BytesIO(b'not a zip'), 'broken.jar'),
+        (jar_bytes('ignored'), 'notes.txt'),
+    ]})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [mod['mod_id'] for mod in body['mods']] == ['modmenu']
+    assert body['mods'][0]['file_path'] == 'modmenu.jar'
+    assert [dep['id'] for dep in body['missing_dependencies']['modmenu']] == ['fabric-api']
+    assert body['minecraft_version'] == '1.20.1'
+    assert body['loader'] == 'fabric'
+
+
+def test_analyze_multipart_log(client):
+    log = io.BytesIO(b'[main/ERROR]: Missing mod: sodium\r\nMixin failed\rfoo bar')
+    response = client.post('/api/analyze', data={'log': (log, 'latest.log')})
+    assert response.status_code == 200
+    issues = response.get_json()['issues']
+    assert [(issue['error_type'], issue['mod_name']) for issue in issues] == [('missing_dependency', 'sodium')]
+
+
+def test_analyze_json_log_content(client):
+    response = client.post('/api/analyze', json={'log_content': 'Missing mod: sodium'})
+    assert response.status_code == 200
+    assert [issue['mod_name'] for issue in response.get_json()['issues']] == ['sodium']
+
+
+def test_analyze_without_log(client):
+    response = client.post('/api/analyze', json={})
+    assert response.get_json() == {'success': True, 'issues': []}